@@ -0,0 +1,186 @@
+"""
+Audio Stream Receiver
+Receives raw PCM audio from ESP32-S3 via TCP and saves as WAV segments.
+Supports both 16-bit and 24-bit formats.
+"""
+
+import socket
+import struct
+import time
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+import logging
+
+# ============================================================
+# Configuration
+# ============================================================
+
+# Audio format (must match ESP32 firmware)
+SAMPLE_RATE = 16000
+CHANNELS = 1
+BITS_PER_SAMPLE = 16
+BYTES_PER_SAMPLE = 2
+SEGMENT_DURATION = 600  # 10 minutes per WAV file
+SEGMENT_SIZE = SAMPLE_RATE * CHANNELS * BYTES_PER_SAMPLE * SEGMENT_DURATION
+DATA_DIR = "/data/audio"
+TCP_PORT = 9000
+TCP_HOST = "0.0.0.0"
+
+# Receive chunk size (~0.6 s of audio at 16 kHz / 16-bit mono)
+TCP_CHUNK_SIZE = 19200
+
+# Logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[
+        logging.FileHandler("/var/log/audio-receiver.log"),
+        logging.StreamHandler(sys.stdout)
+    ]
+)
+logger = logging.getLogger("AudioReceiver")
+
+
+def write_wav_header(f, data_size):
+    """Write WAV file header for PCM mono audio (16-bit or 24-bit)"""
+    # RIFF header
+    f.write(b'RIFF')
+    f.write(struct.pack('<I', 36 + data_size))
+    f.write(b'WAVE')
+
+    # fmt chunk
+    f.write(b'fmt ')
+    f.write(struct.pack('<I', 16))
+    f.write(struct.pack('<H', 1))  # PCM format
+    f.write(struct.pack('<H', CHANNELS))
+    f.write(struct.pack('<I', SAMPLE_RATE))
+    f.write(struct.pack('<I', SAMPLE_RATE * CHANNELS * BYTES_PER_SAMPLE))
+    f.write(struct.pack('<H', CHANNELS * BYTES_PER_SAMPLE))
+    f.write(struct.pack('<H', BITS_PER_SAMPLE))
+
+    # data chunk
+    f.write(b'data')
+    f.write(struct.pack('<I', data_size))
+
+
+def start_new_segment():
+    """Create new WAV file for next segment"""
+    now = datetime.now()
+    date_dir = now.strftime('%Y-%m-%d')
+    date_path = Path(DATA_DIR) / date_dir
+
+    # One folder per day
+    date_path.mkdir(parents=True, exist_ok=True)
+
+    # Filename: 2025-01-01_1230.wav
+    filename = now.strftime('%Y-%m-%d_%H%M') + '.wav'
+    filepath = date_path / filename
+
+    logger.info("Starting new segment: %s", filepath)
+
+    # Header is written up-front with the expected segment size
+    f = open(filepath, 'wb')
+    write_wav_header(f, SEGMENT_SIZE)
+
+    return f, SEGMENT_SIZE, filepath
+
+
+def tcp_server():
+    """Main TCP server loop"""
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+    sock.bind((TCP_HOST, TCP_PORT))
+    sock.listen(1)
+
+    logger.info("Audio receiver listening on %s:%d", TCP_HOST, TCP_PORT)
+    logger.info("Saving segments to: %s", DATA_DIR)
+    logger.info("Segment duration: %d seconds (%d minutes)", SEGMENT_DURATION, SEGMENT_DURATION // 60)
+
+    while True:
+        try:
+
+            logger.info("Waiting for ESP32 connection...")
+            conn, addr = sock.accept()
+            logger.info("Connected: %s", addr)
+
+            # Disable Nagle - we want low-latency audio delivery
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            # Larger receive buffer smooths out WiFi bursts
+            conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+
+            conn.settimeout(30)
+
+            # Start first segment
+            current_file, bytes_left, current_path = start_new_segment()
+            segment_start_time = time.monotonic()
+            total_bytes_received = 0
+
+            while True:
+                try:
+
+                    data = conn.recv(TCP_CHUNK_SIZE)
+
+                    if not data:
+                        logger.warning("Connection closed by client")
+                        break
+
+                    current_file.write(data)
+                    bytes_left -= len(data)
+                    total_bytes_received += len(data)
+
+                    # Segment full - roll over to a new file
+                    if bytes_left <= 0:
+                        segment_duration = time.monotonic() - segment_start_time
+                        logger.info("Segment complete: %s", current_path)
+                        logger.info("  Duration: %.1fs, Size: %.2f MB", segment_duration, total_bytes_received / 1024 / 1024)
+
+                        current_file.close()
+
+                        # Start next segment
+                        current_file, bytes_left, current_path = start_new_segment()
+                        segment_start_time = time.monotonic()
+                        total_bytes_received = 0
+
+                except socket.timeout:
+                    logger.warning("Socket timeout - no data received for 30 seconds")
+                    break
+                except Exception as e:
+                    logger.error("Error receiving data: %s", e)
+                    break
+
+            current_file.close()
+            conn.close()
+            logger.info("Connection closed")
+
+        except KeyboardInterrupt:
+            logger.info("Shutting down...")
+            break
+        except Exception as e:
+            logger.error("Server error: %s", e)
+            time.sleep(5)
+
+    sock.close()
+
+
+def main():
+    """Main entry point"""
+    logger.info("=== Audio Stream Receiver Starting ===")
+    logger.info("Configuration: %d Hz, %d-bit, %d channel(s)", SAMPLE_RATE, BITS_PER_SAMPLE, CHANNELS)
+    logger.info("Segment size: %.2f MB (%d seconds)", SEGMENT_SIZE / 1024 / 1024, SEGMENT_DURATION)
+    logger.info("Listening on: %s:%d", TCP_HOST, TCP_PORT)
+
+    # Make sure the data directory exists
+    if not os.path.exists(DATA_DIR):
+        logger.warning("Data directory %s does not exist, creating...", DATA_DIR)
+        os.makedirs(DATA_DIR, exist_ok=True)
+
+    tcp_server()
+
+
+if __name__ == '__main__':
+    main()
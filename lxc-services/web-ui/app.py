@@ -0,0 +1,298 @@
+"""
+Audio Archive Web UI
+Simple web interface for browsing and playing archived audio segments.
+
+Aligned with ESP32-S3 audio-streamer-xiao firmware v2.0:
+- 16 kHz sample rate, 16-bit mono audio
+- 10-minute WAV segments (approximately 19.2 MB per file)
+- HTTP Basic Authentication for secure access
+"""
+
+from flask import Flask, render_template, send_file, abort, jsonify, request
+from flask_httpauth import HTTPBasicAuth
+from werkzeug.security import check_password_hash, generate_password_hash
+from pathlib import Path
+from datetime import datetime, timedelta
+import hashlib
+import hmac
+import os
+import time
+import logging
+
+app = Flask(__name__)
+auth = HTTPBasicAuth()
+
+# Tighter JSON serialization for the /api endpoints: skip the
+# pretty-printing whitespace and the per-response key sort
+app.json.compact = True
+app.json.sort_keys = False
+
+# Configuration
+DATA_DIR = Path("/data/audio")
+PORT = 8080
+HOST = "0.0.0.0"
+
+# Audio format (must match firmware)
+SAMPLE_RATE = 16000
+BITS_PER_SAMPLE = 16
+CHANNELS = 1
+SEGMENT_DURATION = 600  # seconds
+
+# Credentials come from the environment
+WEB_UI_USERNAME = os.getenv("WEB_UI_USERNAME", "admin")
+WEB_UI_PASSWORD_HASH = generate_password_hash(os.getenv("WEB_UI_PASSWORD", "changeme"))
+
+# Logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("AudioWebUI")
+
+
+def get_date_folders():
+    """Get list of date folders sorted in descending order"""
+    if not DATA_DIR.exists():
+        return []
+
+    folders = []
+    for item in DATA_DIR.iterdir():
+        if item.is_dir() and len(item.name) == 10:
+            try:
+                datetime.strptime(item.name, '%Y-%m-%d')
+                folders.append(item.name)
+            except ValueError:
+                continue
+
+    return sorted(folders, reverse=True)
+
+
+# File types the archive can contain
+_AUDIO_EXTENSIONS = frozenset({'.wav', '.flac'})
+
+# Per-folder listing cache keyed by the directory's mtime. Writing or
+# deleting a segment file bumps the folder mtime, so entries invalidate
+# themselves the moment the archive actually changes. Bounded so a
+# long-running process doesn't hold a listing for every day ever archived;
+# date-named keys sort chronologically, so the oldest day is evicted first.
+_LISTING_CACHE_MAX = 64
+_listing_cache = {}  # date folder name -> (dir mtime, files list)
+
+
+def get_audio_files(date_folder):
+    """Get list of audio files for a specific date"""
+    folder_path = DATA_DIR / date_folder
+    if not folder_path.exists():
+        return []
+
+    dir_mtime = folder_path.stat().st_mtime
+    cached = _listing_cache.get(date_folder)
+    if cached is not None and cached[0] == dir_mtime:
+        return cached[1]
+
+    files = []
+    for item in folder_path.iterdir():
+        # Suffix check first: it is pure string work, while is_file() is a
+        # stat() syscall we can skip for non-audio entries
+        if item.suffix.lower() in _AUDIO_EXTENSIONS and item.is_file():
+            st = item.stat()
+            files.append({
+                'name': item.name,
+                'size': st.st_size,
+                'modified': st.st_mtime
+            })
+
+    files.sort(key=lambda x: x['name'])
+    _listing_cache[date_folder] = (dir_mtime, files)
+    if len(_listing_cache) > _LISTING_CACHE_MAX:
+        del _listing_cache[min(_listing_cache)]
+    return files
+
+
+def format_size(size_bytes):
+    """Format file size in human-readable format"""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size_bytes < 1024.0:
+            return f"{size_bytes:.1f} {unit}"
+        size_bytes /= 1024.0
+    return f"{size_bytes:.1f} TB"
+
+
+# All segments are a fixed length, so the label never changes
+_SEGMENT_DURATION_LABEL = f"{SEGMENT_DURATION // 60}:00"
+
+
+def format_duration(filename):
+    """Extract and format duration from filename"""
+    return _SEGMENT_DURATION_LABEL
+
+
+# Digest of the last credentials that passed the full hash check. Browsers
+# resend the same Basic auth header on every request, so after the first
+# login each request costs one sha256 instead of a full scrypt verification.
+_verified_credentials = None
+
+
+@auth.verify_password
+def verify_password(username, password):
+    """Verify HTTP Basic Auth credentials"""
+    global _verified_credentials
+
+    digest = hashlib.sha256(f"{username}:{password}".encode()).digest()
+    if _verified_credentials is not None and hmac.compare_digest(_verified_credentials, digest):
+        return username
+
+    if (hmac.compare_digest(username.encode(), WEB_UI_USERNAME.encode())
+            and check_password_hash(WEB_UI_PASSWORD_HASH, password)):
+        _verified_credentials = digest
+        return username
+    return None
+
+
+@app.route('/')
+@auth.login_required
+def index():
+    """Main page showing date folders"""
+    folders = get_date_folders()
+    return render_template('index.html', folders=folders)
+
+
+@app.route('/date/<date_folder>')
+@auth.login_required
+def date_view(date_folder):
+    """View audio files for a specific date"""
+    # Validate folder name format to block path traversal
+    try:
+        datetime.strptime(date_folder, '%Y-%m-%d')
+    except ValueError:
+        abort(404)
+
+    files = get_audio_files(date_folder)
+    if not files:
+        abort(404)
+
+    # Add formatted fields for the template
+    for file in files:
+        file['size_formatted'] = format_size(file['size'])
+        file['duration'] = format_duration(file['name'])
+
+    return render_template('date.html', date=date_folder, files=files)
+
+
+@app.route('/download/<date_folder>/<filename>')
+@auth.login_required
+def download(date_folder, filename):
+    """Download audio file"""
+    file_path = DATA_DIR / date_folder / filename
+
+    if not file_path.is_file():
+        abort(404)
+
+    # Security: ensure the resolved path stays inside DATA_DIR
+    try:
+        file_path.resolve().relative_to(DATA_DIR.resolve())
+    except ValueError:
+        abort(403)
+
+    return send_file(file_path, as_attachment=True)
+
+
+@app.route('/stream/<date_folder>/<filename>')
+@auth.login_required
+def stream(date_folder, filename):
+    """Stream audio file for in-browser playback"""
+    file_path = DATA_DIR / date_folder / filename
+
+    if not file_path.is_file():
+        abort(404)
+
+    # Security: ensure the resolved path stays inside DATA_DIR
+    try:
+        file_path.resolve().relative_to(DATA_DIR.resolve())
+    except ValueError:
+        abort(403)
+
+    # conditional=True enables Range requests, so seeking in the browser
+    # player fetches only the requested slice of a ~19 MB segment
+    return send_file(file_path, mimetype='audio/wav', conditional=True)
+
+
+# /api/stats walks every date folder and stats every file, and uptime
+# monitors tend to poll it every few seconds - absorb those bursts with a
+# short-lived cache so only one poll per window pays for the full scan
+_STATS_CACHE_TTL = 5.0  # seconds
+_stats_cache = None  # (monotonic timestamp, payload dict)
+
+
+@app.route('/api/stats')
+@auth.login_required
+def stats():
+    """API endpoint for statistics"""
+    global _stats_cache
+
+    now = time.monotonic()
+    if _stats_cache is not None and now - _stats_cache[0] < _STATS_CACHE_TTL:
+        return jsonify(_stats_cache[1])
+
+    folders = get_date_folders()
+    total_files = 0
+    total_size = 0
+
+    for folder in folders:
+        files = get_audio_files(folder)
+        total_files += len(files)
+        total_size += sum(f['size'] for f in files)
+
+    payload = {
+        'total_dates': len(folders),
+        'total_files': total_files,
+        'total_size': total_size,
+        'total_size_formatted': format_size(total_size)
+    }
+    _stats_cache = (now, payload)
+    return jsonify(payload)
+
+
+@app.route('/api/latest')
+@auth.login_required
+def latest():
+    """API endpoint for latest recordings"""
+    folders = get_date_folders()
+    if not folders:
+        return jsonify([])
+
+    latest_date = folders[0]
+    files = get_audio_files(latest_date)
+
+    return jsonify({
+        'date': latest_date,
+        'files': [{'name': f['name'], 'size': f['size']} for f in files[-5:]]
+    })
+
+
+@app.template_filter('datetime')
+def format_datetime(value):
+    """Format datetime for templates"""
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value).strftime('%Y-%m-%d %H:%M:%S')
+    return value
+
+
+if __name__ == '__main__':
+    logger.info("=== Audio Archive Web UI Starting ===")
+    logger.info(f"Data directory: {DATA_DIR}")
+    logger.info(f"Listening on http://{HOST}:{PORT}")
+    logger.info(f"Audio format: {SAMPLE_RATE} Hz, {BITS_PER_SAMPLE}-bit, {CHANNELS} channel (mono)")
+    logger.info(f"Segment duration: {SEGMENT_DURATION // 60} minutes per file")
+    logger.info(f"Authentication: enabled (user: {WEB_UI_USERNAME})")
+    logger.info("Set WEB_UI_USERNAME and WEB_UI_PASSWORD environment variables to configure credentials")
+
+    if not DATA_DIR.exists():
+        logger.warning(f"Data directory {DATA_DIR} does not exist!")
+
+    if os.getenv("WEB_UI_PASSWORD") is None:
+        logger.warning("WARNING: Using default password 'changeme' - set WEB_UI_PASSWORD environment variable!")
+
+    app.run(host=HOST, port=PORT, debug=False, threaded=True)
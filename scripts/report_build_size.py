@@ -5,7 +5,9 @@ Generates detailed size reports for firmware binaries
 """
 
 import os
+import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -73,7 +75,6 @@ def analyze_elf_sections(elf_path):
         return {}
     
     try:
-        import subprocess
         result = subprocess.run(
             ['xtensa-esp32-elf-size', '-A', str(elf_path)],
             capture_output=True,
@@ -118,10 +119,15 @@ def analyze_elf_sections(elf_path):
 
 def generate_report(project_root):
     """Generate comprehensive build size report"""
-    print(f"\n{Colors.HEADER}{Colors.BOLD}=" * 70)
-    print(f"ESP32 Audio Streamer - Build Artifact Size Report")
-    print(f"=" * 70 + Colors.ENDC)
-    print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    # Collect output per section and flush it in one write - print() would
+    # otherwise lock and flush stdout for every one of the ~25 lines
+    lines = []
+    lines.append(f"\n{Colors.HEADER}{Colors.BOLD}=" * 70)
+    lines.append(f"ESP32 Audio Streamer - Build Artifact Size Report")
+    lines.append(f"=" * 70 + Colors.ENDC)
+    lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
     artifacts = find_build_artifacts(project_root)
     if not artifacts:
@@ -131,9 +137,22 @@ def generate_report(project_root):
     FLASH_SIZE = 4 * 1024 * 1024  # 4MB
     RAM_SIZE = 520 * 1024  # 520KB total (but only ~200KB available for app)
 
+    # Run the external size tool for every environment up front, in parallel.
+    # Each invocation can take up to 10s, so with multiple build environments
+    # the report now takes as long as the slowest one instead of the sum.
+    elf_envs = {env: files for env, files in artifacts.items()
+                if files['firmware_elf'].exists()}
+    elf_sections = {}
+    if elf_envs:
+        with ThreadPoolExecutor(max_workers=len(elf_envs)) as pool:
+            futures = {env: pool.submit(analyze_elf_sections, files['firmware_elf'])
+                       for env, files in elf_envs.items()}
+            elf_sections = {env: future.result() for env, future in futures.items()}
+
     for env_name, files in artifacts.items():
-        print(f"{Colors.OKCYAN}{Colors.BOLD}Environment: {env_name}{Colors.ENDC}")
-        print(f"{'-' * 70}")
+        lines = []
+        lines.append(f"{Colors.OKCYAN}{Colors.BOLD}Environment: {env_name}{Colors.ENDC}")
+        lines.append(f"{'-' * 70}")
 
         # Firmware binary
         firmware_size = get_file_size(files['firmware_bin'])
@@ -141,20 +160,20 @@ def generate_report(project_root):
             flash_percent = calculate_percentage(firmware_size, FLASH_SIZE)
             color = Colors.OKGREEN if flash_percent < 70 else Colors.WARNING if flash_percent < 90 else Colors.FAIL
 
-            print(f"\n{Colors.BOLD}Firmware Binary:{Colors.ENDC}")
-            print(f"  Size: {color}{format_size(firmware_size)}{Colors.ENDC}")
-            print(f"  Flash Usage: {color}{flash_percent:.1f}%{Colors.ENDC} ({format_size(firmware_size)} / {format_size(FLASH_SIZE)})")
+            lines.append(f"\n{Colors.BOLD}Firmware Binary:{Colors.ENDC}")
+            lines.append(f"  Size: {color}{format_size(firmware_size)}{Colors.ENDC}")
+            lines.append(f"  Flash Usage: {color}{flash_percent:.1f}%{Colors.ENDC} ({format_size(firmware_size)} / {format_size(FLASH_SIZE)})")
 
             if flash_percent > 90:
-                print(f"  {Colors.FAIL}⚠️  WARNING: Flash usage > 90%!{Colors.ENDC}")
+                lines.append(f"  {Colors.FAIL}⚠️  WARNING: Flash usage > 90%!{Colors.ENDC}")
             elif flash_percent > 70:
-                print(f"  {Colors.WARNING}⚠️  NOTICE: Flash usage > 70%{Colors.ENDC}")
+                lines.append(f"  {Colors.WARNING}⚠️  NOTICE: Flash usage > 70%{Colors.ENDC}")
 
         # ELF analysis
-        if files['firmware_elf'].exists():
-            sections = analyze_elf_sections(files['firmware_elf'])
+        if env_name in elf_sections:
+            sections = elf_sections[env_name]
             if sections:
-                print(f"\n{Colors.BOLD}Memory Sections:{Colors.ENDC}")
+                lines.append(f"\n{Colors.BOLD}Memory Sections:{Colors.ENDC}")
 
                 # Calculate RAM usage (.data + .bss)
                 data_size = sections.get('.data', 0)
@@ -162,29 +181,31 @@ def generate_report(project_root):
                 ram_usage = data_size + bss_size
                 ram_percent = calculate_percentage(ram_usage, RAM_SIZE)
 
-                print(f"  .text (code):    {format_size(sections.get('.text', 0)):>12}")
-                print(f"  .data (init):    {format_size(data_size):>12}")
-                print(f"  .bss (uninit):   {format_size(bss_size):>12}")
-                print(f"  .rodata (const): {format_size(sections.get('.rodata', 0)):>12}")
+                lines.append(f"  .text (code):    {format_size(sections.get('.text', 0)):>12}")
+                lines.append(f"  .data (init):    {format_size(data_size):>12}")
+                lines.append(f"  .bss (uninit):   {format_size(bss_size):>12}")
+                lines.append(f"  .rodata (const): {format_size(sections.get('.rodata', 0)):>12}")
 
                 color = Colors.OKGREEN if ram_percent < 50 else Colors.WARNING if ram_percent < 80 else Colors.FAIL
-                print(f"\n  {Colors.BOLD}Estimated RAM Usage:{Colors.ENDC} {color}{format_size(ram_usage)}{Colors.ENDC} ({ram_percent:.1f}% of {format_size(RAM_SIZE)})")
+                lines.append(f"\n  {Colors.BOLD}Estimated RAM Usage:{Colors.ENDC} {color}{format_size(ram_usage)}{Colors.ENDC} ({ram_percent:.1f}% of {format_size(RAM_SIZE)})")
 
                 if ram_percent > 80:
-                    print(f"  {Colors.FAIL}⚠️  WARNING: RAM usage > 80%!{Colors.ENDC}")
+                    lines.append(f"  {Colors.FAIL}⚠️  WARNING: RAM usage > 80%!{Colors.ENDC}")
 
         # Partitions
         partitions_size = get_file_size(files['partitions_bin'])
         if partitions_size > 0:
-            print(f"\n{Colors.BOLD}Partitions Table:{Colors.ENDC} {format_size(partitions_size)}")
+            lines.append(f"\n{Colors.BOLD}Partitions Table:{Colors.ENDC} {format_size(partitions_size)}")
 
-        print(f"\n{Colors.BOLD}Build Artifacts:{Colors.ENDC}")
-        print(f"  firmware.bin: {files['firmware_bin']}")
-        print(f"  firmware.elf: {files['firmware_elf']}")
+        lines.append(f"\n{Colors.BOLD}Build Artifacts:{Colors.ENDC}")
+        lines.append(f"  firmware.bin: {files['firmware_bin']}")
+        lines.append(f"  firmware.elf: {files['firmware_elf']}")
 
-        print(f"\n{'-' * 70}\n")
+        lines.append(f"\n{'-' * 70}\n")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
-    print(f"{Colors.OKGREEN}✓ Size report complete{Colors.ENDC}\n")
+    sys.stdout.write(f"{Colors.OKGREEN}✓ Size report complete{Colors.ENDC}\n\n")
     return 0
 
 def main():